@@ -1,7 +1,16 @@
 import asyncio
+import functools
 import json
 import os
-import subprocess
+import re
+import signal
+import time
+try:
+    import orjson # Optional: much faster than json on large outputs like wifi-scaninfo
+except ImportError:
+    orjson = None
+from rich.markup import escape
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Button, Static, Label, Input, Select
 from textual.containers import Container, Vertical, Horizontal
@@ -13,46 +22,196 @@ from textual.widgets import RichLog, ProgressBar # For displaying output clearly
 # --- Helper Functions for Termux API Commands ---
 
 
+# Full path prefix of the termux-api executables (e.g. + "battery-status")
+TERMUX_COMMAND_PREFIX = "/data/data/com.termux/files/usr/bin/termux-"
+
+# Command names whose executable has already been found on disk
+verified_commands: set[str] = set()
+
+# Seconds to wait for a termux-api command before giving up on it
+COMMAND_TIMEOUT = 30.0
+
+# Stream buffer size for command output; wifi-scaninfo can return tens of KB of JSON
+PIPE_READ_LIMIT = 1 << 20
+
+# Extracts the level from termux-brightness JSON output ('"level": X')
+BRIGHTNESS_LEVEL_RE = re.compile(r'level"\s*:\s*(\d+)')
+
+# Seconds a read-only query result is reused before the command is run again
+CACHE_TTL = 5.0
+
+# Read-only queries (command name + args) whose results are safe to reuse
+CACHEABLE_QUERIES = {
+    ("battery-status",),
+    ("telephony-deviceinfo",),
+    ("wifi-scaninfo",),
+    ("brightness",),
+    ("volume",),
+}
+
+# Cached queries made stale by a successful write command
+INVALIDATED_BY = {
+    "brightness": ("brightness",),
+    "wifi-enable": ("wifi-scaninfo",),
+    "volume": ("volume",),
+}
+
+
+def is_error_result(result: str) -> bool:
+    """Tells whether run_termux_command returned one of its error messages."""
+    return result.startswith(("Error", "An unexpected error occurred"))
+
+
+def ttl_cache(seconds: float):
+    """
+    Caches the results of the read-only queries in CACHEABLE_QUERIES for `seconds`.
+
+    Every other command always runs, and a successful write drops the cached
+    queries listed for it in INVALIDATED_BY. Errors are never cached.
+    The wrapped function gets a `cache_clear()` method.
+    """
+    def decorator(func):
+        cache: dict[tuple, tuple[float, str]] = {}
+
+        @functools.wraps(func)
+        async def wrapper(command_name: str, *args, **kwargs) -> str:
+            key = (command_name, *args)
+            cacheable = key in CACHEABLE_QUERIES and kwargs.get("input_text") is None
+            if cacheable:
+                hit = cache.get(key)
+                if hit is not None and time.monotonic() - hit[0] < seconds:
+                    return hit[1]
+
+            result = await func(command_name, *args, **kwargs)
+            if is_error_result(result):
+                return result
+
+            if cacheable:
+                cache[key] = (time.monotonic(), result)
+            elif command_name in INVALIDATED_BY:
+                cache.pop(INVALIDATED_BY[command_name], None)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+# Background waits on cancelled commands, kept here so they aren't garbage collected early
+reaping_processes: set[asyncio.Future] = set()
+
+def kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """Kills a command started by run_termux_command along with every child it spawned."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass # Already gone
+
 # Helper to run a Termux API command and return its output
-def run_termux_command(command_name: str, *args, input_text: str = None) -> str:
+@ttl_cache(CACHE_TTL)
+async def run_termux_command(command_name: str, *args, input_text: str = None, timeout: float = COMMAND_TIMEOUT) -> str:
     """
-    Runs a termux-api command and captures its output.
+    Runs a termux-api command without blocking the event loop and captures its output.
 
     Args:
         command_name: The base name of the termux-api command (e.g., "torch", "battery-status").
         *args: Additional arguments for the command (e.g., "-n", "phone_number").
         input_text: Optional text to pass to the command's stdin.
+        timeout: Seconds to wait for the command to finish (None waits forever).
 
     Returns:
         The stripped standard output of the command, or an error message.
     """
-    # Define the full path to the termux-api executable base
-    TERMUX_BIN_PATH = "/data/data/com.termux/files/usr/bin/"
-    full_command_path = os.path.join(TERMUX_BIN_PATH, f"termux-{command_name}") # Use f-string for clarity
+    full_command_path = TERMUX_COMMAND_PREFIX + command_name
+    command_list = (full_command_path, *args)
 
-    command_list = [full_command_path] + list(args)
+    # Only look for the executable the first time a command is used
+    if command_name not in verified_commands:
+        if not os.path.exists(full_command_path):
+            return f"Error: Command '{full_command_path}' not found. Please ensure termux-api package is installed and the command exists."
+        verified_commands.add(command_name)
 
     try:
-        process = subprocess.run(
-            command_list, # Pass the list of arguments correctly
-            capture_output=True,
-            text=True,
-            check=True,
-            input=input_text
+        process = await asyncio.create_subprocess_exec(
+            *command_list,
+            stdin=asyncio.subprocess.PIPE if input_text is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=PIPE_READ_LIMIT,
+            # termux-* are sh wrappers around a child process; give them their own group so it can be killed too
+            start_new_session=True,
         )
-        return process.stdout.strip()
     except FileNotFoundError:
         return f"Error: Command '{full_command_path}' not found. Please ensure termux-api package is installed and the command exists."
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
+        return f"An unexpected error occurred: {e}"
+
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(input_text.encode() if input_text is not None else None),
+            timeout
+        )
+    except asyncio.TimeoutError:
+        kill_process_group(process)
+        await process.wait()
+        return f"Error: Command '{' '.join(command_list)}' timed out after {timeout} seconds."
+    except asyncio.CancelledError:
+        # Nobody wants the result any more, don't leave the command running
+        if process.returncode is None:
+            kill_process_group(process)
+            # Reap it in the background so the cancel itself doesn't wait on the child
+            reaper = asyncio.ensure_future(process.wait())
+            reaping_processes.add(reaper)
+            reaper.add_done_callback(reaping_processes.discard)
+        raise
+    except Exception as e:
+        return f"An unexpected error occurred: {e}"
+
+    # Pipes are read as raw bytes and decoded once here, not line by line
+    stdout = stdout.decode("utf-8", "replace").strip()
+    stderr = stderr.decode("utf-8", "replace").strip()
+    if process.returncode != 0:
         # Provide more detailed error info for debugging
         return (
             f"Error executing '{' '.join(command_list)}':\n"
-            f"Return Code: {e.returncode}\n"
-            f"STDOUT: {e.stdout.strip() if e.stdout else '[No stdout]'}\n"
-            f"STDERR: {e.stderr.strip() if e.stderr else '[No stderr]'}"
+            f"Return Code: {process.returncode}\n"
+            f"STDOUT: {stdout if stdout else '[No stdout]'}\n"
+            f"STDERR: {stderr if stderr else '[No stderr]'}"
         )
-    except Exception as e:
-        return f"An unexpected error occurred: {e}"
+    return stdout
+
+# Helper to parse a constant log message's markup only once
+@functools.lru_cache(maxsize=None)
+def static_markup(markup: str) -> Text:
+    """Returns the Text for a fixed markup string, parsed on first use and reused after."""
+    return Text.from_markup(markup)
+
+# Helper to re-indent JSON text, using orjson when it is installed
+def pretty_json(raw: str) -> str:
+    """Returns `raw` re-indented by 2 spaces. Raises json.JSONDecodeError if it is not JSON."""
+    if orjson is not None:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return orjson.dumps(orjson.loads(raw), option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(json.loads(raw), indent=2)
+
+# Helper to pretty-print a JSON command result for the log/dialogs
+def format_json_result(label: str, result: str) -> str:
+    """Returns the JSON output indented under a label, or the raw output if it is not JSON."""
+    try:
+        parsed_json = pretty_json(result)
+        return f"[green]{label}:[/green]\n[white]{escape(parsed_json)}[/white]"
+    except json.JSONDecodeError:
+        return f"[red]Error parsing JSON:[/red]\n{escape(result)}"
+
+# Helper to read one stream's level out of termux-volume output
+def current_volume_percentage(volume_info: str, stream: str, default: str = "50") -> str:
+    """Returns the stream's current volume as a percentage string, or `default` if unknown."""
+    try:
+        for entry in json.loads(volume_info):
+            if entry.get("stream") == stream and entry.get("max_volume"):
+                return str(round(entry["volume"] * 100 / entry["max_volume"]))
+    except (json.JSONDecodeError, TypeError, KeyError, AttributeError):
+        pass
+    return default
 
 # --- Custom Modal Dialogs for Input/Confirmation ---
 
@@ -141,268 +300,199 @@ class TermuxApiApp(App):
 
     # Store a reference to the RichLog for output
     log_output: RichLog
+    # Shows which commands are running while we await them
+    busy_indicator: Static
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._running_commands: list[str] = []
+        # Button id -> handler, so one Button.Pressed handler can route every menu press
+        self._handlers = {
+            button_id: getattr(self, handler_name)
+            for _, button_id, handler_name, _ in self.MENU_BUTTONS
+        }
 
     BINDINGS = [
         ("q", "quit", "Quit"),
         ("d", "toggle_dark", "Toggle dark mode"),
+        ("c", "clear_cache", "Clear cache"),
     ]
 
-    # --- CSS Styling ---
-    CSS = """
-    Screen {
-        background: #1e1e1e;
-        color: white;
-        layout: vertical;
-        align: center middle;
-    }
-
-    #header {
-        background: blue;
-        color: white;
-        text-align: center;
-        padding: 1 0;
-        width: 100%;
-    }
-
-    #menu-container {
-        layout: grid;
-        grid-size: 2; /* 2 columns */
-        grid-rows: auto;
-        grid-columns: 1fr 1fr;
-        grid-gutter: 2;
-        width: 90%;
-        height: auto; /* Let content dictate height */
-        padding: 1;
-        border: solid #6a0dad; /* Purple border */
-        margin-top: 2;
-    }
-
-    .menu-button {
-        width: 100%; /* Take full grid cell width */
-        height: 3;
-        background: #2a2a2a;
-        color: white;
-        border: solid dodgerblue;
-        text-align: center;
-    }
-
-    .menu-button:hover {
-        background: dodgerblue;
-    }
-
-    #output-log {
-        border: panel green;
-        width: 90%;
-        height: 30%; /* Give it enough height for output */
-        margin-top: 2;
-        background: #333333;
-        padding: 1;
-    }
-
-    /* Styles for the modal dialogs */
-    .dialog-box {
-        background: #333333;
-        border: thick $primary;
-        width: 60%;
-        height: auto;
-        padding: 2;
-        align: center middle;
-        layout: vertical;
-    }
-
-    .dialog-title {
-        text-align: center;
-        text-style: bold;
-        color: $primary;
-        margin-bottom: 1;
-    }
-
-    .dialog-content {
-        text-align: center;
-        margin-bottom: 2;
-        padding: 0 2; /* Add horizontal padding for text */
-    }
-
-    .dialog-buttons {
-        layout: horizontal;
-        align: center middle;
-        margin-top: 1;
-        width: 100%;
-    }
-
-    .dialog-buttons Button {
-        margin: 0 1;
-    }
-
-   Input {
-        width: 80%;
-        /* Remove 'margin: 1 auto;' - centering will be handled by the parent container's layout */
-        margin-top: 1; /* You can keep explicit vertical margins if needed */
-        margin-bottom: 1;
-        background: #444444;
-        color: white;
-        border: round #666666;
-        text-align: left;
-    }
-    Input:focus {
-        border: round dodgerblue;
-    }
-    """
+    # Menu buttons: (label, button id, handler method name, button variant)
+    MENU_BUTTONS = (
+        ("1. Toggle Torch", "btn_torch", "toggle_torch", "default"),
+        ("2. Battery Status", "btn_battery", "show_battery_status", "default"),
+        ("3. Send SMS", "btn_sms", "send_sms", "default"),
+        ("4. Set Brightness", "btn_brightness", "set_brightness", "default"),
+        ("5. Toggle Wi-Fi", "btn_wifi_toggle", "toggle_wifi", "default"),
+        ("6. Scan Wi-Fi", "btn_wifi_scan", "scan_wifi", "default"),
+        ("7. Control Volume", "btn_volume", "control_volume", "default"),
+        ("8. Device Info", "btn_device_info", "show_device_info", "default"),
+        ("9. Play Beep", "btn_beep", "play_beep", "default"),
+        ("R. Refresh All", "btn_refresh_all", "refresh_all", "default"),
+        ("0. Exit", "btn_exit", "exit_app", "error"),
+    )
+
+    # --- CSS Styling (kept in termx.tcss, next to this file) ---
+    CSS_PATH = "termx.tcss"
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         yield Header(id="header")
         yield Label("Termux API Quick Access Menu", classes="instruction-label")
         yield Container(
-            Button("1. Toggle Torch", id="btn_torch", classes="menu-button"),
-            Button("2. Battery Status", id="btn_battery", classes="menu-button"),
-            Button("3. Send SMS", id="btn_sms", classes="menu-button"),
-            Button("4. Set Brightness", id="btn_brightness", classes="menu-button"),
-            Button("5. Toggle Wi-Fi", id="btn_wifi_toggle", classes="menu-button"),
-            Button("6. Scan Wi-Fi", id="btn_wifi_scan", classes="menu-button"),
-            Button("7. Control Volume", id="btn_volume", classes="menu-button"),
-            Button("8. Device Info", id="btn_device_info", classes="menu-button"),
-            Button("9. Play Beep", id="btn_beep", classes="menu-button"),
-            Button("0. Exit", id="btn_exit", variant="error", classes="menu-button"),
+            *(
+                Button(label, id=button_id, variant=variant, classes="menu-button")
+                for label, button_id, _, variant in self.MENU_BUTTONS
+            ),
             id="menu-container"
         )
+        self.busy_indicator = Static("", id="busy-indicator")
+        yield self.busy_indicator
         # Use RichLog for better display of multi-line output
-        self.log_output = RichLog(id="output-log", auto_scroll=True, max_lines=100)
+        self.log_output = RichLog(id="output-log", auto_scroll=True, max_lines=100, markup=True)
         yield self.log_output
         yield Footer()
 
     def on_mount(self) -> None:
         """Called after the app is mounted and widgets are composed."""
-        self.log_output.write("[bold green]Welcome to Termux API TUI![/bold green]")
-        self.log_output.write("Select an option above to run a command.")
+        self.log_output.write(static_markup("[bold green]Welcome to Termux API TUI![/bold green]"))
+        self.log_output.write(static_markup("Select an option above to run a command."))
+
+    async def run_command(self, command_name: str, *args, **kwargs) -> str:
+        """Runs a termux-api command while the busy indicator is shown."""
+        # Several commands can be in flight at once (see refresh_all)
+        self._running_commands.append(command_name)
+        self._update_busy_indicator()
+        try:
+            return await run_termux_command(command_name, *args, **kwargs)
+        finally:
+            self._running_commands.remove(command_name)
+            self._update_busy_indicator()
+
+    def _update_busy_indicator(self) -> None:
+        if self._running_commands:
+            names = ", ".join(f"termux-{name}" for name in self._running_commands)
+            self.busy_indicator.update(f"[yellow]Running {names}...[/yellow]")
+        else:
+            self.busy_indicator.update("")
 
     # --- Button Event Handlers ---
 
-    @on(Button.Pressed, "#btn_torch")
+    @on(Button.Pressed)
+    async def on_menu_button_pressed(self, event: Button.Pressed) -> None:
+        handler = self._handlers.get(event.button.id)
+        if handler is not None:
+            # Run as a worker so the message pump stays free while the command and its dialogs run
+            self.run_worker(handler(), exclusive=False)
+
     async def toggle_torch(self) -> None:
-        self.log_output.write("[blue]Toggling torch...[/blue]")
-        result = run_termux_command("torch")
-        self.log_output.write(f"[green]Torch status: {result}[/green]")
+        self.log_output.write(static_markup("[blue]Toggling torch...[/blue]"))
+        result = await self.run_command("torch")
+        self.log_output.write(f"[green]Torch status: {escape(result)}[/green]")
         await self.push_screen(MessageDialog("Torch Toggled", f"Torch command executed.\nResult: {result}"))
 
-    @on(Button.Pressed, "#btn_battery")
     async def show_battery_status(self) -> None:
-        self.log_output.write("[blue]Fetching battery status...[/blue]")
-        result = run_termux_command("battery-status")
-        try:
-            parsed_json = json.dumps(json.loads(result), indent=2)
-            display_text = f"[green]Battery Info:[/green]\n[white]{parsed_json}[/white]"
-        except json.JSONDecodeError:
-            display_text = f"[red]Error parsing JSON:[/red]\n{result}"
-
+        self.log_output.write(static_markup("[blue]Fetching battery status...[/blue]"))
+        result = await self.run_command("battery-status")
+        display_text = format_json_result("Battery Info", result)
         self.log_output.write(display_text)
         await self.push_screen(MessageDialog("Battery Status", display_text))
 
-    @on(Button.Pressed, "#btn_sms")
     async def send_sms(self) -> None:
-        self.log_output.write("[blue]Initiating SMS send...[/blue]")
-        number = await self.push_screen_and_wait(
-            InputDialog("Send SMS", "Enter phone number (e.g., +1234567890):")
+        self.log_output.write(static_markup("[blue]Initiating SMS send...[/blue]"))
+        number = await self.push_screen(
+            InputDialog("Send SMS", "Enter phone number (e.g., +1234567890):"),
+            wait_for_dismiss=True,
         )
         if number is None:
-            self.log_output.write("[yellow]SMS sending cancelled.[/yellow]")
+            self.log_output.write(static_markup("[yellow]SMS sending cancelled.[/yellow]"))
             return
 
-        message = await self.push_screen_and_wait(
-            InputDialog("Send SMS", "Enter message:")
+        message = await self.push_screen(
+            InputDialog("Send SMS", "Enter message:"),
+            wait_for_dismiss=True,
         )
         if message is None:
-            self.log_output.write("[yellow]SMS sending cancelled.[/yellow]")
+            self.log_output.write(static_markup("[yellow]SMS sending cancelled.[/yellow]"))
             return
 
-        confirm = await self.push_screen_and_wait(
-            ConfirmationDialog("Confirm SMS", f"Send SMS to {number} with message:\n'{message}'?")
+        confirm = await self.push_screen(
+            ConfirmationDialog("Confirm SMS", f"Send SMS to {number} with message:\n'{message}'?"),
+            wait_for_dismiss=True,
         )
 
         if confirm:
-            self.log_output.write(f"[blue]Sending SMS to {number} with message: '{message}'[/blue]")
-            result = run_termux_command("sms-send", "-n", number, message)
-            self.log_output.write(f"[green]SMS command result: {result}[/green]")
+            self.log_output.write(f"[blue]Sending SMS to {escape(number)} with message: '{escape(message)}'[/blue]")
+            result = await self.run_command("sms-send", "-n", number, message)
+            self.log_output.write(f"[green]SMS command result: {escape(result)}[/green]")
             await self.push_screen(MessageDialog("SMS Status", f"SMS command issued.\nResult: {result}"))
         else:
-            self.log_output.write("[yellow]SMS sending cancelled.[/yellow]")
+            self.log_output.write(static_markup("[yellow]SMS sending cancelled.[/yellow]"))
 
-    @on(Button.Pressed, "#btn_brightness")
     async def set_brightness(self) -> None:
-        self.log_output.write("[blue]Setting screen brightness...[/blue]")
+        self.log_output.write(static_markup("[blue]Setting screen brightness...[/blue]"))
         # Attempt to get current brightness for default value
-        current_brightness_info = run_termux_command("brightness")
-        current_brightness_level = "128" # Default if fetching fails
-        try:
-            # Simple regex to extract number assuming 'level":X' format
-            import re
-            match = re.search(r'level":(\d+)', current_brightness_info)
-            if match:
-                current_brightness_level = match.group(1)
-        except Exception:
-            pass # Ignore if we can't parse it
-
-        level_str = await self.push_screen_and_wait(
-            InputDialog("Set Brightness", "Enter brightness level (0-255):", default=current_brightness_level)
+        current_brightness_info = await self.run_command("brightness")
+        match = BRIGHTNESS_LEVEL_RE.search(current_brightness_info)
+        current_brightness_level = match.group(1) if match else "128" # Default if fetching fails
+
+        level_str = await self.push_screen(
+            InputDialog("Set Brightness", "Enter brightness level (0-255):", default=current_brightness_level),
+            wait_for_dismiss=True,
         )
         if level_str is None:
-            self.log_output.write("[yellow]Brightness setting cancelled.[/yellow]")
+            self.log_output.write(static_markup("[yellow]Brightness setting cancelled.[/yellow]"))
             return
 
-        try:
-            level = int(level_str)
-            if not (0 <= level <= 255):
-                await self.push_screen(MessageDialog("Error", "Invalid brightness level. Please enter a number between 0 and 255."))
-                self.log_output.write("[red]Invalid brightness level.[/red]")
-                return
-        except ValueError:
+        # isdecimal() only passes strings int() can convert, so there is no ValueError to catch
+        level_str = level_str.strip()
+        if not level_str.isdecimal():
             await self.push_screen(MessageDialog("Error", "Invalid input. Please enter a numeric value."))
-            self.log_output.write("[red]Invalid brightness input (not a number).[/red]")
+            self.log_output.write(static_markup("[red]Invalid brightness input (not a number).[/red]"))
+            return
+        level = int(level_str)
+        if not (0 <= level <= 255):
+            await self.push_screen(MessageDialog("Error", "Invalid brightness level. Please enter a number between 0 and 255."))
+            self.log_output.write(static_markup("[red]Invalid brightness level.[/red]"))
             return
 
         self.log_output.write(f"[blue]Setting brightness to {level}...[/blue]")
-        result = run_termux_command("brightness", str(level))
-        self.log_output.write(f"[green]Brightness command result: {result}[/green]")
+        result = await self.run_command("brightness", str(level))
+        self.log_output.write(f"[green]Brightness command result: {escape(result)}[/green]")
         await self.push_screen(MessageDialog("Brightness Set", f"Brightness set to {level}.\nResult: {result}"))
 
-    @on(Button.Pressed, "#btn_wifi_toggle")
     async def toggle_wifi(self) -> None:
-        self.log_output.write("[blue]Toggling Wi-Fi...[/blue]")
-        confirm_enable = await self.push_screen_and_wait(
-            ConfirmationDialog("Wi-Fi Control", "Do you want to [bold green]enable[/bold green] Wi-Fi?\n(Choose No to [bold red]disable[/bold red])")
+        self.log_output.write(static_markup("[blue]Toggling Wi-Fi...[/blue]"))
+        confirm_enable = await self.push_screen(
+            ConfirmationDialog("Wi-Fi Control", "Do you want to [bold green]enable[/bold green] Wi-Fi?\n(Choose No to [bold red]disable[/bold red])"),
+            wait_for_dismiss=True,
         )
 
         if confirm_enable is True: # User chose Yes
-            self.log_output.write("[blue]Enabling Wi-Fi...[/blue]")
-            result = run_termux_command("wifi-enable", "true")
-            self.log_output.write(f"[green]Wi-Fi enable command result: {result}[/green]")
+            self.log_output.write(static_markup("[blue]Enabling Wi-Fi...[/blue]"))
+            result = await self.run_command("wifi-enable", "true")
+            self.log_output.write(f"[green]Wi-Fi enable command result: {escape(result)}[/green]")
             await self.push_screen(MessageDialog("Wi-Fi Status", f"Wi-Fi enabled (command issued).\nResult: {result}"))
         elif confirm_enable is False: # User chose No
-            self.log_output.write("[blue]Disabling Wi-Fi...[/blue]")
-            result = run_termux_command("wifi-enable", "false")
-            self.log_output.write(f"[green]Wi-Fi disable command result: {result}[/green]")
+            self.log_output.write(static_markup("[blue]Disabling Wi-Fi...[/blue]"))
+            result = await self.run_command("wifi-enable", "false")
+            self.log_output.write(f"[green]Wi-Fi disable command result: {escape(result)}[/green]")
             await self.push_screen(MessageDialog("Wi-Fi Status", f"Wi-Fi disabled (command issued).\nResult: {result}"))
         else: # User cancelled
-            self.log_output.write("[yellow]Wi-Fi toggle cancelled.[/yellow]")
+            self.log_output.write(static_markup("[yellow]Wi-Fi toggle cancelled.[/yellow]"))
 
 
-    @on(Button.Pressed, "#btn_wifi_scan")
     async def scan_wifi(self) -> None:
-        self.log_output.write("[blue]Scanning for Wi-Fi networks...[/blue]")
-        result = run_termux_command("wifi-scaninfo")
-        try:
-            parsed_json = json.dumps(json.loads(result), indent=2)
-            display_text = f"[green]Available Wi-Fi Networks:[/green]\n[white]{parsed_json}[/white]"
-        except json.JSONDecodeError:
-            display_text = f"[red]Error parsing JSON:[/red]\n{result}"
-
+        self.log_output.write(static_markup("[blue]Scanning for Wi-Fi networks...[/blue]"))
+        result = await self.run_command("wifi-scaninfo")
+        display_text = format_json_result("Available Wi-Fi Networks", result)
         self.log_output.write(display_text)
         await self.push_screen(MessageDialog("Wi-Fi Scan Results", display_text))
 
 
-    @on(Button.Pressed, "#btn_volume")
     async def control_volume(self) -> None:
-        self.log_output.write("[blue]Controlling volume...[/blue]")
+        self.log_output.write(static_markup("[blue]Controlling volume...[/blue]"))
         stream_options = [
             ("alarm", "Alarm volume"),
             ("media", "Media playback volume"),
@@ -417,65 +507,84 @@ class TermuxApiApp(App):
             prompt="Select a volume stream",
             id="volume_stream_select"
         )
-        # This will block until a selection is made
-        stream = await self.push_screen_and_wait(stream_select)
+        # Read the current levels while the user is still picking a stream
+        current_volumes = asyncio.create_task(self.run_command("volume"))
+        stream = None
+        try:
+            # This will block until a selection is made
+            stream = await self.push_screen(stream_select, wait_for_dismiss=True)
+        finally:
+            # Stop the read if the dialog was cancelled or failed, its result won't be used
+            if stream is None:
+                current_volumes.cancel()
 
         if stream is None:
-            self.log_output.write("[yellow]Volume control cancelled.[/yellow]")
+            self.log_output.write(static_markup("[yellow]Volume control cancelled.[/yellow]"))
             return
 
-        percentage_str = await self.push_screen_and_wait(
-            InputDialog("Set Volume", f"Enter volume percentage (0-100) for '{stream}':", default="50")
+        current_percentage = current_volume_percentage(await current_volumes, stream)
+        percentage_str = await self.push_screen(
+            InputDialog("Set Volume", f"Enter volume percentage (0-100) for '{stream}':", default=current_percentage),
+            wait_for_dismiss=True,
         )
 
         if percentage_str is None:
-            self.log_output.write("[yellow]Volume control cancelled.[/yellow]")
+            self.log_output.write(static_markup("[yellow]Volume control cancelled.[/yellow]"))
             return
 
-        try:
-            percentage = int(percentage_str)
-            if not (0 <= percentage <= 100):
-                await self.push_screen(MessageDialog("Error", "Invalid percentage. Please enter a number between 0 and 100."))
-                self.log_output.write("[red]Invalid volume percentage.[/red]")
-                return
-        except ValueError:
+        # isdecimal() only passes strings int() can convert, so there is no ValueError to catch
+        percentage_str = percentage_str.strip()
+        if not percentage_str.isdecimal():
             await self.push_screen(MessageDialog("Error", "Invalid input. Please enter a numeric value."))
-            self.log_output.write("[red]Invalid volume input (not a number).[/red]")
+            self.log_output.write(static_markup("[red]Invalid volume input (not a number).[/red]"))
+            return
+        percentage = int(percentage_str)
+        if not (0 <= percentage <= 100):
+            await self.push_screen(MessageDialog("Error", "Invalid percentage. Please enter a number between 0 and 100."))
+            self.log_output.write(static_markup("[red]Invalid volume percentage.[/red]"))
             return
 
-        self.log_output.write(f"[blue]Setting {stream} volume to {percentage}%...[/blue]")
-        result = run_termux_command("volume", stream, str(percentage))
-        self.log_output.write(f"[green]Volume command result: {result}[/green]")
+        self.log_output.write(f"[blue]Setting {escape(stream)} volume to {percentage}%...[/blue]")
+        result = await self.run_command("volume", stream, str(percentage))
+        self.log_output.write(f"[green]Volume command result: {escape(result)}[/green]")
         await self.push_screen(MessageDialog("Volume Set", f"{stream} volume set to {percentage}%.\nResult: {result}"))
 
-    @on(Button.Pressed, "#btn_device_info")
     async def show_device_info(self) -> None:
-        self.log_output.write("[blue]Fetching device information...[/blue]")
+        self.log_output.write(static_markup("[blue]Fetching device information...[/blue]"))
         # Using telephony-deviceinfo as an example, other API commands like info might exist.
-        result = run_termux_command("telephony-deviceinfo")
-        try:
-            parsed_json = json.dumps(json.loads(result), indent=2)
-            display_text = f"[green]Device Details:[/green]\n[white]{parsed_json}[/white]"
-        except json.JSONDecodeError:
-            display_text = f"[red]Error parsing JSON:[/red]\n{result}"
-
+        result = await self.run_command("telephony-deviceinfo")
+        display_text = format_json_result("Device Details", result)
         self.log_output.write(display_text)
         await self.push_screen(MessageDialog("Device Info", display_text))
 
-    @on(Button.Pressed, "#btn_beep")
     async def play_beep(self) -> None:
-        self.log_output.write("[blue]Playing a short beep sound...[/blue]")
+        self.log_output.write(static_markup("[blue]Playing a short beep sound...[/blue]"))
         # No direct beep command, using toast for visual feedback
-        result = run_termux_command("toast", "Beep!", "-g", "bottom") # '-g bottom' places toast at bottom
+        result = await self.run_command("toast", "Beep!", "-g", "bottom") # '-g bottom' places toast at bottom
         # Alternatively, for an audible beep using TTS:
-        # result = run_termux_command("tts-speak", "Beep")
-        self.log_output.write(f"[green]Beep command result: {result}[/green]")
+        # result = await self.run_command("tts-speak", "Beep")
+        self.log_output.write(f"[green]Beep command result: {escape(result)}[/green]")
         await self.push_screen(MessageDialog("Beep Played", f"Beep command executed.\nResult: {result}"))
 
 
-    @on(Button.Pressed, "#btn_exit")
+    async def refresh_all(self) -> None:
+        self.log_output.write(static_markup("[blue]Fetching battery, device and Wi-Fi info...[/blue]"))
+        # These queries don't depend on each other, so wait for the slowest instead of all three in turn
+        results = await asyncio.gather(
+            self.run_command("battery-status"),
+            self.run_command("telephony-deviceinfo"),
+            self.run_command("wifi-scaninfo"),
+            return_exceptions=True
+        )
+        labels = ("Battery Info", "Device Details", "Available Wi-Fi Networks")
+        for label, result in zip(labels, results):
+            if isinstance(result, Exception):
+                self.log_output.write(f"[red]{label}: An unexpected error occurred: {escape(str(result))}[/red]")
+            else:
+                self.log_output.write(format_json_result(label, result))
+
     async def exit_app(self) -> None:
-        self.log_output.write("[yellow]Exiting Termux API Menu. Goodbye![/yellow]")
+        self.log_output.write(static_markup("[yellow]Exiting Termux API Menu. Goodbye![/yellow]"))
         await self.push_screen(MessageDialog("Exiting", "Exiting Termux API Menu. Goodbye!"))
         self.exit("User exited.")
 
@@ -486,6 +595,10 @@ class TermuxApiApp(App):
     def action_toggle_dark(self) -> None:
         self.dark = not self.dark
 
+    def action_clear_cache(self) -> None:
+        run_termux_command.cache_clear()
+        self.log_output.write(static_markup("[yellow]Command cache cleared.[/yellow]"))
+
 if __name__ == "__main__":
     app = TermuxApiApp()
     app.run()
@@ -1,13 +1,43 @@
 import csv
+import re
 
 filename = 'contacts.csv'
+FIELDNAMES = ('Name', 'Phone')
+PHONE_RE = re.compile(r'[0-9*+#]+')
+MENU_STR = "\n1. Add\n2. Retrieve\n3. Display\n4. Quit\n\nChoice --> "
 contact_dict = {}  # Declare contact_dict as a global variable
+contacts_cache = {}  # filename -> list of (name, phone), read from disk once per run
+sorted_contacts_cache = {}  # filename -> contacts sorted by name, dropped whenever a contact is added
+
+
+def open_csv_read(filename):
+    # Large read buffer so the whole file is pulled in with a few read() calls
+    return open(filename, 'r', newline='', buffering=65536)
+
+
+def load_contacts(filename):
+    if filename not in contacts_cache:
+        contacts = []
+        try:
+            with open_csv_read(filename) as csvfile:
+                reader = csv.DictReader(csvfile)
+                for row in reader:
+                    contacts.append((row['Name'], row['Phone']))
+        except FileNotFoundError:
+            pass
+        contacts_cache[filename] = contacts
+    return contacts_cache[filename]
+
+
+def sorted_contacts(filename):
+    if filename not in sorted_contacts_cache:
+        sorted_contacts_cache[filename] = sorted(load_contacts(filename), key=lambda x: x[0])  # Sort contacts alphabetically by name
+    return sorted_contacts_cache[filename]
 
 
 def add_contact(name, phone, filename):
     with open(filename, 'a', newline='') as csvfile:
-        fieldnames = ['Name', 'Phone']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
 
         # Write header if the file is empty
         if csvfile.tell() == 0:
@@ -16,48 +46,42 @@ def add_contact(name, phone, filename):
         # Write the contact details
         writer.writerow({'Name': name, 'Phone': phone})
 
-
-def find_contact(name, filename):
-    with open(filename, 'r', newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-
-        for row in reader:
-            if row['Name'] == name:
-                return row['Phone']
-        return None
+    # Keep the in-memory copy in sync so later reads don't hit the file
+    if filename in contacts_cache:
+        contacts_cache[filename].append((name, str(phone)))
+    sorted_contacts_cache.pop(filename, None)
 
 
 def display_contacts(filename, operation):
-    contacts = []
-    with open(filename, 'r', newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            contacts.append((row['Name'], row['Phone']))
+    contacts = sorted_contacts(filename)
 
     if len(contacts) == 0:
         print("\n*** No Data ***")
         return
 
-    contacts.sort(key=lambda x: x[0])  # Sort contacts alphabetically by name
-
     if operation == "display":
-        print("\n-- Contacts --")
-        for i, (name, phone) in enumerate(contacts, 1):
-            print(f"{i}. {name}, {phone}")
+        lines = ["\n-- Contacts --"]
+        lines.extend(f"{i}. {name}, {phone}" for i, (name, phone) in enumerate(contacts, 1))
+        print("\n".join(lines))
         return
 
     else: # elif operation == "retrieve":
-        print("\n-- Contacts List --")
-        for i, (name, phone) in enumerate(contacts, 1):
-            print(f"{i}. {name}")
-    return {str(i): name for i, (name, _) in enumerate(contacts, 1)}
+        lines = ["\n-- Contacts List --"]
+        lines.extend(f"{i}. {name}" for i, (name, _) in enumerate(contacts, 1))
+        print("\n".join(lines))
+    return {str(i): contact for i, contact in enumerate(contacts, 1)}
 
 
 def main():
     global contact_dict  # Access the global contact_dict variable
 
     while True:
-        operation = int(input("\n1. Add\n2. Retrieve\n3. Display\n4. Quit\n\nChoice --> "))
+        try:
+            operation = int(input(MENU_STR))
+        except ValueError:
+            print("\nInvalid choice")
+            continue
+
         if operation == 1:
             print("\n-- Add a Contact --")
             name = input("Enter contact name (leave blank to cancel): ")
@@ -68,7 +92,10 @@ def main():
             if len(name) == 0 or name.count(" ") == len(name):
                 continue
 
-            phone = int(input("Enter phone number: "))
+            phone = input("Enter phone number: ").strip()
+            if not PHONE_RE.fullmatch(phone):
+                print("Invalid Phone Number")
+                continue
 
             add_contact(name, phone, filename)
             print(f"\nContact '{name}' with phone number '{phone}' added successfully.")
@@ -86,8 +113,8 @@ def main():
                 continue
 
             if choice in contact_dict:
-                name = contact_dict[choice]
-                phone = find_contact(name, filename)
+                # Phone is already known from the listing, no need to scan the file again
+                name, phone = contact_dict[choice]
                 if phone:
                     print(f"The phone number for '{name}' is '{phone}'.")
                 else:
@@ -0,0 +1,63 @@
+import asyncio
+import subprocess
+import time
+
+import pytest
+
+import TermX_Assistor
+
+
+@pytest.fixture
+def termux_bin(tmp_path, monkeypatch):
+    monkeypatch.setattr(TermX_Assistor, "TERMUX_COMMAND_PREFIX", str(tmp_path / "termux-"))
+    TermX_Assistor.verified_commands.clear()
+    TermX_Assistor.run_termux_command.cache_clear()
+
+    def make_command(name, body):
+        path = tmp_path / f"termux-{name}"
+        path.write_text(f"#!/bin/sh\n{body}\n")
+        path.chmod(0o755)
+    return make_command
+
+
+def child_running(pattern, grace=1.0):
+    # SIGKILL is delivered asynchronously, give the child a moment to go away
+    deadline = time.monotonic() + grace
+    while subprocess.run(["pgrep", "-f", pattern], capture_output=True).returncode == 0:
+        if time.monotonic() > deadline:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_timeout_kills_wrapper_children(termux_bin):
+    # Like the real termux-* wrappers: sh runs the child without exec
+    termux_bin("slow", "sleep 7.31\necho done")
+    start = time.monotonic()
+    result = asyncio.run(TermX_Assistor.run_termux_command("slow", timeout=0.5))
+    assert result.startswith("Error: Command") and "timed out" in result
+    assert time.monotonic() - start < 2
+    assert not child_running("sleep 7.31")
+
+
+def test_returns_stdout(termux_bin):
+    termux_bin("echo", 'echo "$@"')
+    assert asyncio.run(TermX_Assistor.run_termux_command("echo", "hi")) == "hi"
+
+
+def test_cancel_kills_wrapper_children(termux_bin):
+    termux_bin("slow", "sleep 7.32\necho done")
+
+    async def cancel_soon():
+        task = asyncio.create_task(TermX_Assistor.run_termux_command("slow"))
+        await asyncio.sleep(0.3)
+        start = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert time.monotonic() - start < 0.5
+        # The background reap finishes once the whole group is gone
+        await asyncio.wait_for(asyncio.gather(*TermX_Assistor.reaping_processes), 2)
+
+    asyncio.run(cancel_soon())
+    assert not child_running("sleep 7.32")
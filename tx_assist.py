@@ -1,12 +1,9 @@
 import os
+import subprocess
+import sys
 from time import sleep, strftime, localtime
 from random import choice
 from re import match
-try:
-    from colorama import Fore as f, Style as s
-except ImportError:
-    print("\nThis script requires colorama module. Install it using the command \"pip install colorama\" and try again.\n\nExiting...\n")
-    exit(1)
 
 
 ## ===========================================================================
@@ -31,18 +28,38 @@ NOTIFICATION_LIST = ['Say \'SubhanAllah\' X 3',
                     '\'Allahu Akbar\' while Climbing \'UP\'',
                     '\'SubhanAllah\' while Climbing \'DOWN\'']
 ALLOWED_PHONE_CHARS = r'^[0-9*+#]+$'
-
-CYAN = f.CYAN
-LIGHT_CYAN = f.LIGHTCYAN_EX
-YELLOW = f.YELLOW
-RED = f.RED
-BOLD = s.BRIGHT
-DIM, RESET = s.DIM, s.RESET_ALL
+VIBRATE_COMMAND = ["termux-vibrate", "-f", "-d", "1500"]
+YES_ANSWERS = frozenset(('Y', 'YES'))
+VOLUME_STREAMS = ("System", "Call", "Ring", "Music", "Notification", "Alarm")
+VOLUME_MENU_CHOICES = {str(i): stream for i, stream in enumerate(VOLUME_STREAMS, 1)}  # '1' -> 'System', ...
+
+# ANSI escape codes (Termux understands them natively)
+CYAN = "\033[36m"
+LIGHT_CYAN = "\033[96m"
+YELLOW = "\033[33m"
+RED = "\033[31m"
+BOLD = "\033[1m"
+DIM, RESET = "\033[2m", "\033[0m"
+
+# Menu prompts, built once since they never change
+VOLUME_MENU = (f"{CYAN}0. Exit       1. System        2. Call        3. Ring\n"
+               f"4. Music      5. Notification       6. Alarm{RESET}\n\n---> ")
+SETTINGS_MENU = (f"{LIGHT_CYAN}0. Exit         1. Torch on/off         "
+                 f"2. Call \n3. Send SMS     4. WIFI on/off     5. Get Random Notifications\n"
+                 f"6. Volume adjust     7. Silent Phone     8. Volume Up\n\n---> {RESET}")
 
 
 ## ===========================================================================
 ### Functions
 
+# Function to animate a progress line with dots
+def print_dots(count, delay):
+    for i in range(count):
+        sys.stdout.write(".")
+        sys.stdout.flush()
+        sleep(delay)
+
+## --------------------------------------------------------------------------
 # Function to toggle torch
 def termx_torch():
     global torch_state
@@ -85,11 +102,9 @@ def termux_telephony_call():
 
         print(f"\nCalling \'{phoneNumber}\'",end='',flush = True)
 
-        for i in range(7):
-            print(".",end = "", flush = True)
-            sleep(0.25)
+        print_dots(7, 0.25)
         print("\n")
-        exit()
+        sys.exit()
 
 ## --------------------------------------------------------------------------
 # Function to send sms
@@ -119,9 +134,7 @@ def termux_sms_send():
 
             print("\nSending",end = "", flush =True)
 
-            for i in range(7):
-                print(".",end = "", flush = True)
-                sleep(0.25)
+            print_dots(7, 0.25)
 
             print(f"\n\nMessage \"{text[:32]}\".... is sent to \'{phoneNumber}\'\n")
             break
@@ -148,6 +161,14 @@ def termux_wifi_enable():
     else :
         print(f"{RED}{DIM}Please enter between \'o\' or \'f\'\n{RESET}")
 
+## --------------------------------------------------------------------------
+# Function to announce when the next notification is due
+def print_next_notification(next_time):
+    # One print for the whole block instead of one per line
+    print(f"{YELLOW}{BOLD}\n------ Getting Random Notification ------{RESET}\n"
+          f"{DIM}Next Notification at : --- {next_time} ---{RESET}\n"
+          f"{DIM}Press \' ctrl + c \' to Cancel...{RESET}\n")
+
 ## --------------------------------------------------------------------------
 # Function to get notifications
 def termux_notification():
@@ -156,7 +177,7 @@ def termux_notification():
     notificationSound = input("\nPlay Notification sound.... "
                                 f"Phone will be removed from Silent Mode [\'y\' or \'n\'] : ").upper()
 
-    if notificationSound in ['Y', 'YES'] :
+    if notificationSound in YES_ANSWERS :
         os.system("termux-volume ring 100")
         os.system("termux-volume notification 100")
         print()
@@ -186,20 +207,13 @@ def termux_notification():
     if start_min != current_min:
         start_min = current_min
 
-    print(f"{YELLOW}{BOLD}\n------ Getting Random Notification ------{RESET}")
-
     if start_min + notificationDelay > 59:
         current_hour = current_hour + 1
         display_min = start_min + notificationDelay - 60
     else:
         display_min = start_min + notificationDelay
 
-    if display_min < 10:
-        print(f"{DIM}Next Notification at : --- {current_hour}:0{display_min} ---{RESET}")
-    else:
-        print(f"{DIM}Next Notification at : --- {current_hour}:{display_min} ---{RESET}")
-
-    print(f"{DIM}Press \' ctrl + c \' to Cancel...{RESET}\n")
+    print_next_notification(f"{current_hour}:{display_min:02}")
 
     while True:
         try:
@@ -220,65 +234,57 @@ def termux_notification():
 
                 print(f"\n{randamNotification}\n")
 
-                if vibration in ['Y', 'YES'] :
-                    os.system("termux-vibrate -f -d 1500")
-                    pass
-                if flash in ['Y', 'YES'] :
+                if vibration in YES_ANSWERS :
+                    # Fire and forget, no need to wait for termux-vibrate to return
+                    try:
+                        subprocess.Popen(VIBRATE_COMMAND, stdin=subprocess.DEVNULL,
+                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    except FileNotFoundError:
+                        pass  # termux-api not installed, skip the vibration
+                if flash in YES_ANSWERS :
                     os.system("termux-torch on")
                     sleep(0.25)
                     os.system("termux-torch off")
 
                 start_min = next_notification_min
 
-                print(f"{YELLOW}{BOLD}\n------ Getting Random Notification ------{RESET}")
-
                 if start_min == 0:
-                    print(f"{DIM}Next Notification at : --- {current_hour - 1}:0{start_min + notificationDelay} ---{RESET}")
-
-                elif start_min + notificationDelay < 10:
-                    print(f"{DIM}Next Notification at : --- {current_hour}:0{start_min + notificationDelay} ---{RESET}")
+                    print_next_notification(f"{current_hour - 1}:{start_min + notificationDelay:02}")
 
                 elif start_min + notificationDelay == 60:
-                    print(f"{DIM}Next Notification at : --- {current_hour + 1}:00 ---{RESET}")
+                    print_next_notification(f"{current_hour + 1}:00")
 
                 else:
-                    print(f"{DIM}Next Notification at : --- {current_hour}:{start_min + notificationDelay} ---{RESET}")
+                    print_next_notification(f"{current_hour}:{start_min + notificationDelay:02}")
 
-                print(f"{DIM}Press \' ctrl + c \' to Cancel...{RESET}\n")
                 sleep(notificationDelay * 60 - 3)
 
         except KeyboardInterrupt:
             print(f"\nNotifications cancelled.\nExiting",end='',flush = True)
-            for i in range(5):
-                print(".",end = "", flush = True)
-                sleep(0.2)
+            print_dots(5, 0.2)
             print("\n")
-            exit()
+            sys.exit()
 
 ## --------------------------------------------------------------------------
 # Function to adjust volumw od audio streams
 def volume_change(vol_name):
     while True:
         print(f"{YELLOW}{BOLD}\n------ {vol_name} ------\n{RESET}")
-        try:
-            volume = input(f"Enter {vol_name} Volume [0 - 100] : ")
-
-            if volume in ['',' ']:
-                print(f"\n{vol_name} Volume is Unaltered\n")
-                break
+        volume = input(f"Enter {vol_name} Volume [0 - 100] : ").strip()
 
-            elif 0 <= int(volume) and int(volume) <= 100:
-                os.system(f'termux-volume {vol_name.lower()} {volume}')
-                print(f"\n{vol_name} Volume is set to {volume}\n")
-                break
+        if volume == '':
+            print(f"\n{vol_name} Volume is Unaltered\n")
+            break
 
-            else:
-                print(f"{RED}\nInvalid Volume input. Please enter Integer value between "
-                        f"[0 - 100]\n{DIM}Just press \'Enter\' to Exit.{RESET}")
+        elif volume.isdecimal() and int(volume) <= 100:
+            volume = int(volume)
+            os.system(f'termux-volume {vol_name.lower()} {volume}')
+            print(f"\n{vol_name} Volume is set to {volume}\n")
+            break
 
-        except:
-            print(f"{RED}\nInvalid Volume input. Please enter Integer value between [0 - 100]\n"
-                    f"{DIM}Just press \'Enter\' to Exit.{RESET}")
+        else:
+            print(f"{RED}\nInvalid Volume input. Please enter Integer value between "
+                    f"[0 - 100]\n{DIM}Just press \'Enter\' to Exit.{RESET}")
 
 ###
 # volume control
@@ -287,48 +293,29 @@ def termux_volume():
     while True :
         print(f"{YELLOW}{BOLD}\n------ Volume Adjust ------\n{RESET}")
 
-        volume_input = input(f"{CYAN}0. Exit       1. System        2. Call        3. Ring\n"
-                                f"4. Music      5. Notification       6. Alarm{RESET}\n\n---> ")
+        volume_input = input(VOLUME_MENU)
 
         if volume_input in ['',' ','0'] :
             print()
             break
-        elif volume_input == '1' :
-            volume_change("System")
-        elif volume_input == '2' :
-            volume_change("Call")
-        elif volume_input == '3' :
-            volume_change("Ring")
-        elif volume_input == '4' :
-            volume_change("Music")
-        elif volume_input == '5' :
-            volume_change("Notification")
-        elif volume_input == '6' :
-            volume_change("Alarm")
+        elif volume_input in VOLUME_MENU_CHOICES :
+            volume_change(VOLUME_MENU_CHOICES[volume_input])
         else :
             print(f"{RED}{BOLD}\nUnrecognised Input{RESET}\n{RED}{DIM}Select any from [1 - 6]{RESET}\n")
 
 ## --------------------------------------------------------------------------
 # Function to set all audio streams volume to 0
 def silent_phone():
-    os.system(f'termux-volume system 0')
-    os.system(f'termux-volume call 0')
-    os.system(f'termux-volume ring 0')
-    os.system(f'termux-volume music 0')
-    os.system(f'termux-volume notification 0')
-    os.system(f'termux-volume alarm 0')
+    for stream in VOLUME_STREAMS:
+        os.system(f'termux-volume {stream.lower()} 0')
 
     print(f"{CYAN}\nAll Audio Streams are set to \'0\'{RESET}\n\n")
 
 ## --------------------------------------------------------------------------
 # Function to set all audio streams volume to 100
 def volume_up():
-    os.system(f'termux-volume system 100')
-    os.system(f'termux-volume call 100')
-    os.system(f'termux-volume ring 100')
-    os.system(f'termux-volume music 100')
-    os.system(f'termux-volume notification 100')
-    os.system(f'termux-volume alarm 100')
+    for stream in VOLUME_STREAMS:
+        os.system(f'termux-volume {stream.lower()} 100')
 
     print(f"{CYAN}\nAll Audio Streams are set to \'100\'{RESET}\n\n")
 
@@ -337,43 +324,32 @@ def volume_up():
 ## Main function to execute all the steps
 #
 
+# Menu choice -> function to run
+SETTINGS_ACTIONS = {
+    '1': termx_torch,
+    '2': termux_telephony_call,
+    '3': termux_sms_send,
+    '4': termux_wifi_enable,
+    '5': termux_notification,
+    '6': termux_volume,
+    '7': silent_phone,
+    '8': volume_up,
+}
+
 def mySettings():
     print(f"{YELLOW}{BOLD}Choose the following function to perform on your phone :-\n{RESET}")
 
-    setting = input(f"{LIGHT_CYAN}0. Exit         1. Torch on/off         "
-                    f"2. Call \n3. Send SMS     4. WIFI on/off     5. Get Random Notifications\n"
-                    f"6. Volume adjust     7. Silent Phone     8. Volume Up\n\n---> {RESET}")
+    setting = input(SETTINGS_MENU)
 
     if setting in ['','0','exit'] :
         os.system("clear")
-        exit()
-
-    elif setting == '1' :
-        termx_torch()
-
-    elif setting == '2' :
-        termux_telephony_call()
-
-    elif setting == '3' :
-        termux_sms_send()
-
-    elif setting == '4' :
-        termux_wifi_enable()
-
-    elif setting == '5' :
-        termux_notification()
-
-    elif setting == '6' :
-        termux_volume()
-
-    elif setting == '7' :
-        silent_phone()
+        sys.exit()
 
-    elif setting == '8' :
-        volume_up()
+    elif setting in SETTINGS_ACTIONS :
+        SETTINGS_ACTIONS[setting]()
 
     else:
-        print(f"{RED}{BOLD}\nUnrecognised Input{RESET}\n{RED}{DIM}Select any from [0 - 5]{RESET}\n")
+        print(f"{RED}{BOLD}\nUnrecognised Input{RESET}\n{RED}{DIM}Select any from [0 - 8]{RESET}\n")
 
 
 ### MAIN